@@ -0,0 +1,29 @@
+-- Migração SQLite: índices para consultas quentes do servidor e dos importadores
+-- Versão: 20260214_018_indices_consultas
+-- Detectados por scripts/check-query-plans.py (SCAN completo em urede_cidades e
+-- busca de contato existente usando apenas idx_coop_contatos_tipo2).
+
+BEGIN;
+PRAGMA foreign_keys=ON;
+
+CREATE TABLE IF NOT EXISTS schema_migrations (
+  version    TEXT PRIMARY KEY,
+  applied_at TEXT NOT NULL DEFAULT (CURRENT_TIMESTAMP)
+);
+
+-- Cidades atendidas por uma cooperativa (WHERE ID_SINGULAR = ?)
+CREATE INDEX IF NOT EXISTS idx_urede_cidades_id_singular
+  ON urede_cidades(ID_SINGULAR);
+
+-- Resolução de cidade por código IBGE de 6 dígitos (WHERE CD_MUNICIPIO_7 = ? OR CD_MUNICIPIO = ?)
+CREATE INDEX IF NOT EXISTS idx_urede_cidades_cd_municipio
+  ON urede_cidades(CD_MUNICIPIO);
+
+-- Checagem de contato já existente (WHERE id_singular = ? AND tipo = ? AND valor = ?)
+CREATE INDEX IF NOT EXISTS idx_coop_contatos_singular_tipo_valor
+  ON urede_cooperativa_contatos(id_singular, tipo, valor);
+
+INSERT OR IGNORE INTO schema_migrations(version)
+VALUES ('20260214_018_indices_consultas');
+
+COMMIT;
@@ -78,6 +78,7 @@ CREATE TABLE IF NOT EXISTS urede_cooperativa_contatos (
 CREATE INDEX IF NOT EXISTS idx_coop_contatos_id_singular ON urede_cooperativa_contatos(id_singular);
 CREATE INDEX IF NOT EXISTS idx_coop_contatos_tipo2 ON urede_cooperativa_contatos(tipo);
 CREATE INDEX IF NOT EXISTS idx_coop_contatos_subtipo ON urede_cooperativa_contatos(subtipo);
+CREATE INDEX IF NOT EXISTS idx_coop_contatos_singular_tipo_valor ON urede_cooperativa_contatos(id_singular, tipo, valor);
 
 CREATE TABLE IF NOT EXISTS urede_cooperativa_extras (
   id_singular TEXT NOT NULL REFERENCES urede_cooperativas(id_singular) ON DELETE CASCADE,
@@ -251,6 +252,8 @@ CREATE UNIQUE INDEX IF NOT EXISTS urede_cidades_pkey ON urede_cidades(CD_MUNICIP
 CREATE INDEX IF NOT EXISTS idx_urede_cidades_reg_ans            ON urede_cidades(reg_ans);
 CREATE INDEX IF NOT EXISTS idx_urede_cidades_id_singular_cred   ON urede_cidades(id_singular_credenciamento);
 CREATE INDEX IF NOT EXISTS idx_urede_cidades_id_singular_vendas ON urede_cidades(id_singular_vendas);
+CREATE INDEX IF NOT EXISTS idx_urede_cidades_id_singular        ON urede_cidades(ID_SINGULAR);
+CREATE INDEX IF NOT EXISTS idx_urede_cidades_cd_municipio       ON urede_cidades(CD_MUNICIPIO);
 
 CREATE VIEW IF NOT EXISTS urede_cidades_cadastro AS
 SELECT
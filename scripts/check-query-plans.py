@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Guarda de regressão de planos de consulta (EXPLAIN QUERY PLAN) do SQLite.
+
+Monta um banco em memória a partir de db/sqlite_schema.sql + db/migrations/sqlite,
+popula com dados sintéticos em escala realista e verifica que as consultas dos
+importadores e as consultas quentes do servidor (por id_singular, CD_MUNICIPIO_7
+e pedidos por status) usam índice em vez de SCAN completo.
+
+Em seguida repete as consultas numa base 10x maior e registra os tempos.
+
+Uso:
+  python3 scripts/check-query-plans.py [--timing-scale 10] [--report tempos.json]
+
+Sai com código 1 se alguma consulta cair em SCAN onde um índice era esperado.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import random
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHEMA_PATH = os.path.join(ROOT_DIR, "db", "sqlite_schema.sql")
+MIGRATIONS_DIR = os.path.join(ROOT_DIR, "db", "migrations", "sqlite")
+
+# Volumes base (escala 1), próximos aos de bases_csv/ e do uso em produção.
+BASE_COOPERATIVAS = 111
+BASE_CIDADES = 5570
+BASE_CONTATOS_POR_COOP = 20
+BASE_ENDERECOS_POR_COOP = 3
+BASE_PEDIDOS = 5000
+
+PEDIDO_STATUS = ("novo", "em_andamento", "concluido", "cancelado")
+CONTATO_TIPOS = ("email", "telefone", "whatsapp", "website")
+
+
+@dataclass(frozen=True)
+class PlanCheck:
+    nome: str
+    sql: str
+    tabela: str
+    indices: Tuple[str, ...]
+
+
+# Consultas copiadas dos importadores (scripts/) e de database/functions/server/index.tsx.
+# Parâmetros são preenchidos a partir dos dados sintéticos em sample_params().
+CHECKS: List[PlanCheck] = [
+    PlanCheck(
+        "import-contatos-rows: contato existente",
+        """
+        SELECT 1
+        FROM urede_cooperativa_contatos
+        WHERE id_singular = ?
+          AND lower(trim(tipo)) = ?
+          AND (
+            CASE WHEN lower(trim(tipo))='email' THEN lower(trim(valor)) ELSE trim(valor) END
+          ) = ?
+        LIMIT 1
+        """,
+        "urede_cooperativa_contatos",
+        ("idx_coop_contatos_singular_tipo_valor", "idx_coop_contatos_id_singular"),
+    ),
+    PlanCheck(
+        "import_contatos_csv / server: contato existente",
+        "SELECT 1 FROM urede_cooperativa_contatos WHERE id_singular = ? AND tipo = ? AND valor = ? LIMIT 1",
+        "urede_cooperativa_contatos",
+        ("idx_coop_contatos_singular_tipo_valor",),
+    ),
+    PlanCheck(
+        "server: cooperativa por id_singular",
+        "SELECT * FROM urede_cooperativas WHERE id_singular = ? LIMIT 1",
+        "urede_cooperativas",
+        ("sqlite_autoindex_urede_cooperativas_1", "urede_cooperativas_pkey"),
+    ),
+    PlanCheck(
+        "server: contatos da cooperativa",
+        "SELECT * FROM urede_cooperativa_contatos WHERE id_singular = ? ORDER BY ativo DESC",
+        "urede_cooperativa_contatos",
+        ("idx_coop_contatos_id_singular",),
+    ),
+    PlanCheck(
+        "server: endereços da cooperativa",
+        "SELECT * FROM urede_cooperativa_enderecos WHERE id_singular = ? ORDER BY ativo DESC",
+        "urede_cooperativa_enderecos",
+        ("idx_coop_enderecos_id_singular",),
+    ),
+    PlanCheck(
+        "server: endereços por CD_MUNICIPIO_7",
+        "SELECT * FROM urede_cooperativa_enderecos WHERE cd_municipio_7 = ?",
+        "urede_cooperativa_enderecos",
+        ("idx_coop_enderecos_cd_municipio_7",),
+    ),
+    PlanCheck(
+        "server: cidade por CD_MUNICIPIO_7",
+        "SELECT CD_MUNICIPIO_7, NM_CIDADE, UF_MUNICIPIO FROM urede_cidades WHERE CD_MUNICIPIO_7 = ? LIMIT 1",
+        "urede_cidades",
+        ("sqlite_autoindex_urede_cidades_1", "urede_cidades_pkey"),
+    ),
+    PlanCheck(
+        "server: cidade por CD_MUNICIPIO_7 ou CD_MUNICIPIO",
+        """
+        SELECT CD_MUNICIPIO_7, CD_MUNICIPIO, NM_CIDADE, UF_MUNICIPIO, ID_SINGULAR
+          FROM urede_cidades
+         WHERE CD_MUNICIPIO_7 = ? OR CD_MUNICIPIO = ?
+         LIMIT 1
+        """,
+        "urede_cidades",
+        ("idx_urede_cidades_cd_municipio",),
+    ),
+    PlanCheck(
+        "server: cidades da cooperativa (ID_SINGULAR)",
+        "SELECT CD_MUNICIPIO_7 FROM urede_cidades WHERE ID_SINGULAR = ?",
+        "urede_cidades",
+        ("idx_urede_cidades_id_singular",),
+    ),
+    PlanCheck(
+        "server: pedidos abertos da cooperativa responsável",
+        "SELECT * FROM urede_pedidos WHERE cooperativa_responsavel_id = ? AND status NOT IN ('concluido', 'cancelado')",
+        "urede_pedidos",
+        ("idx_pedidos_coop_resp",),
+    ),
+    PlanCheck(
+        "server: escalonamento (status para checagem de prazo)",
+        "SELECT * FROM urede_pedidos WHERE status IN ('novo','em_andamento') AND (nivel_atual IS NULL OR nivel_atual <> 'confederacao')",
+        "urede_pedidos",
+        ("idx_pedidos_status",),
+    ),
+    PlanCheck(
+        "server: pedido por id",
+        "SELECT * FROM urede_pedidos WHERE id = ? LIMIT 1",
+        "urede_pedidos",
+        ("sqlite_autoindex_urede_pedidos_1", "urede_pedidos_pkey"),
+    ),
+]
+
+
+def apply_migration(conn: sqlite3.Connection, sql: str) -> None:
+    # Executa comando a comando para tolerar ADD COLUMN de colunas que o
+    # schema consolidado já possui; qualquer outro erro interrompe.
+    buf = ""
+    try:
+        for line in sql.splitlines(keepends=True):
+            buf += line
+            if not sqlite3.complete_statement(buf):
+                continue
+            stmt, buf = buf.strip(), ""
+            try:
+                conn.execute(stmt)
+            except sqlite3.OperationalError as e:
+                if "duplicate column name" not in str(e):
+                    raise
+    except sqlite3.DatabaseError:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+
+
+def build_db() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    with open(SCHEMA_PATH, "r", encoding="utf-8") as f:
+        conn.executescript(f.read())
+    # Mesma regra do migrate-sqlite-db.sh: pula versões já registradas.
+    for path in sorted(glob.glob(os.path.join(MIGRATIONS_DIR, "*.sql"))):
+        version = os.path.splitext(os.path.basename(path))[0]
+        if conn.execute("SELECT 1 FROM schema_migrations WHERE version = ? LIMIT 1", (version,)).fetchone():
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            apply_migration(conn, f.read())
+    conn.execute("PRAGMA foreign_keys=OFF")
+    return conn
+
+
+def fill_db(conn: sqlite3.Connection, scale: int, rng: random.Random) -> None:
+    n_coops = min(BASE_COOPERATIVAS * scale, 999)
+    coops = [str(i).zfill(3) for i in range(1, n_coops + 1)]
+    cidades = [str(1100000 + i) for i in range(BASE_CIDADES * scale)]
+
+    conn.execute("BEGIN")
+    conn.executemany(
+        "INSERT INTO urede_cooperativas (id_singular, UNIODONTO, TIPO, OP_PR) VALUES (?, ?, 'SINGULAR', 'Operadora')",
+        [(c, f"Uniodonto {c}") for c in coops],
+    )
+    conn.executemany(
+        "INSERT INTO urede_cidades (CD_MUNICIPIO_7, CD_MUNICIPIO, NM_CIDADE, UF_MUNICIPIO, ID_SINGULAR) VALUES (?, ?, ?, 'SP', ?)",
+        [(cd, cd[:6], f"Cidade {cd}", rng.choice(coops)) for cd in cidades],
+    )
+    contatos = []
+    for c in coops:
+        for i in range(BASE_CONTATOS_POR_COOP):
+            tipo = CONTATO_TIPOS[i % len(CONTATO_TIPOS)]
+            valor = f"contato{i}@coop{c}.com.br" if tipo == "email" else f"1199{int(c):03d}{i:04d}"
+            contatos.append((c, tipo, "institucional", valor))
+    conn.executemany(
+        "INSERT INTO urede_cooperativa_contatos (id_singular, tipo, subtipo, valor) VALUES (?, ?, ?, ?)",
+        contatos,
+    )
+    conn.executemany(
+        "INSERT INTO urede_cooperativa_enderecos (id_singular, tipo, cd_municipio_7) VALUES (?, ?, ?)",
+        [
+            (c, "sede" if i == 0 else "filial", rng.choice(cidades))
+            for c in coops
+            for i in range(BASE_ENDERECOS_POR_COOP)
+        ],
+    )
+    hoje = datetime(2026, 1, 1)
+    conn.executemany(
+        """
+        INSERT INTO urede_pedidos
+          (id, titulo, cooperativa_solicitante_id, cooperativa_responsavel_id, cidade_id, status, nivel_atual, prazo_atual)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (
+                f"ped-{i}",
+                f"Pedido {i}",
+                rng.choice(coops),
+                rng.choice(coops),
+                rng.choice(cidades),
+                rng.choice(PEDIDO_STATUS),
+                rng.choice(("singular", "federacao", "confederacao")),
+                (hoje + timedelta(days=rng.randint(-30, 30))).isoformat(),
+            )
+            for i in range(BASE_PEDIDOS * scale)
+        ],
+    )
+    conn.execute("COMMIT")
+
+
+def sample_params(conn: sqlite3.Connection) -> Dict[str, tuple]:
+    contato = conn.execute(
+        "SELECT id_singular, tipo, valor FROM urede_cooperativa_contatos ORDER BY rowid DESC LIMIT 1"
+    ).fetchone()
+    id_singular = contato[0]
+    cd7 = conn.execute("SELECT CD_MUNICIPIO_7 FROM urede_cidades ORDER BY rowid DESC LIMIT 1").fetchone()[0]
+    pedido_id = conn.execute("SELECT id FROM urede_pedidos ORDER BY rowid DESC LIMIT 1").fetchone()[0]
+    return {
+        "import-contatos-rows: contato existente": contato,
+        "import_contatos_csv / server: contato existente": contato,
+        "server: cooperativa por id_singular": (id_singular,),
+        "server: contatos da cooperativa": (id_singular,),
+        "server: endereços da cooperativa": (id_singular,),
+        "server: endereços por CD_MUNICIPIO_7": (cd7,),
+        "server: cidade por CD_MUNICIPIO_7": (cd7,),
+        "server: cidade por CD_MUNICIPIO_7 ou CD_MUNICIPIO": (cd7[:6], cd7[:6]),
+        "server: cidades da cooperativa (ID_SINGULAR)": (id_singular,),
+        "server: pedidos abertos da cooperativa responsável": (id_singular,),
+        "server: escalonamento (status para checagem de prazo)": (),
+        "server: pedido por id": (pedido_id,),
+    }
+
+
+def check_plan(conn: sqlite3.Connection, check: PlanCheck, params: tuple) -> Optional[str]:
+    details = [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + check.sql, params).fetchall()]
+    plan = " / ".join(details)
+    for d in details:
+        if d.startswith(f"SCAN {check.tabela}"):
+            return f"SCAN completo em {check.tabela}: {plan}"
+    for d in details:
+        if d.startswith(f"SEARCH {check.tabela} ") and any(f"INDEX {ix} " in d + " " for ix in check.indices):
+            return None
+    return f"índice esperado ({', '.join(check.indices)}) não usado: {plan}"
+
+
+def time_query(conn: sqlite3.Connection, sql: str, params: tuple, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        conn.execute(sql, params).fetchall()
+    return (time.perf_counter() - start) * 1000.0 / repeat
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--timing-scale", type=int, default=10, help="Multiplicador de volume para a medição de tempos")
+    ap.add_argument("--repeat", type=int, default=50, help="Execuções por consulta na medição de tempos")
+    ap.add_argument("--report", help="Grava os tempos medidos em JSON neste caminho")
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+
+    conn = build_db()
+    fill_db(conn, 1, rng)
+    params = sample_params(conn)
+    failures: List[str] = []
+    for check in CHECKS:
+        erro = check_plan(conn, check, params[check.nome])
+        if erro:
+            failures.append(f"{check.nome}: {erro}")
+            print(f"[check-query-plans] FAIL {check.nome}: {erro}", file=sys.stderr)
+        else:
+            print(f"[check-query-plans] OK   {check.nome}")
+    conn.close()
+
+    conn = build_db()
+    fill_db(conn, args.timing_scale, rng)
+    params = sample_params(conn)
+    timings: Dict[str, float] = {}
+    print(f"[check-query-plans] Tempos na escala {args.timing_scale}x (ms por execução, média de {args.repeat}):")
+    for check in CHECKS:
+        ms = time_query(conn, check.sql, params[check.nome], args.repeat)
+        timings[check.nome] = round(ms, 4)
+        print(f"  {ms:9.3f}  {check.nome}")
+    conn.close()
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(
+                {"timing_scale": args.timing_scale, "repeat": args.repeat, "ms": timings, "failures": failures},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        print(f"[check-query-plans] Relatório: {args.report}")
+
+    if failures:
+        print(f"[check-query-plans] {len(failures)} consulta(s) sem índice esperado.", file=sys.stderr)
+        return 1
+    print("[check-query-plans] OK")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
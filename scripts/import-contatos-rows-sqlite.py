@@ -7,11 +7,26 @@ import re
 import shutil
 import sqlite3
 import sys
+from pathlib import Path
 from urllib.parse import urlparse, urlunparse
 
 
 EMAIL_RE = re.compile(r"^[A-Z0-9._%+\-]+@[A-Z0-9.\-]+\.[A-Z]{2,}$", re.IGNORECASE)
 
+# Quantidade de linhas exibidas no diff de amostra do dry-run.
+DIFF_SAMPLE = 10
+
+# Linhas duplicadas já existentes (mantém uma por rowid).
+DUPLICADOS_WHERE = """
+    rowid NOT IN (
+      SELECT MIN(rowid)
+      FROM urede_cooperativa_contatos
+      GROUP BY id_singular,
+               lower(trim(tipo)),
+               CASE WHEN lower(trim(tipo))='email' THEN lower(trim(valor)) ELSE trim(valor) END
+    )
+"""
+
 
 def normalize_id_singular(value: str) -> str | None:
     raw = (value or "").strip()
@@ -140,11 +155,35 @@ def backup_db(db_path: str, backups_dir: str) -> str:
     return dst
 
 
+def load_db_in_memory(db_path: str) -> sqlite3.Connection:
+    # Abre o arquivo somente leitura e copia para :memory: via backup API,
+    # sem copiar arquivo nem segurar lock de escrita no DB de produção.
+    src = sqlite3.connect(Path(db_path).resolve().as_uri() + "?mode=ro", uri=True)
+    mem = sqlite3.connect(":memory:")
+    try:
+        src.backup(mem)
+    finally:
+        src.close()
+    return mem
+
+
+def print_diff_sample(deleted: list[tuple], inserted: list[tuple], total_deleted: int, total_inserted: int) -> None:
+    print("[import-contatos] Amostra do diff (id_singular | tipo | valor):")
+    for r in deleted:
+        print(f"  - {r[0]} | {r[1]} | {r[2]}")
+    if total_deleted > len(deleted):
+        print(f"  - ... (+{total_deleted - len(deleted)} removidos)")
+    for r in inserted:
+        print(f"  + {r[0]} | {r[1]} | {r[2]}")
+    if total_inserted > len(inserted):
+        print(f"  + ... (+{total_inserted - len(inserted)} inseridos)")
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--db", default="data/urede.db.nwal")
     ap.add_argument("--csv", required=True)
-    ap.add_argument("--dry-run", action="store_true")
+    ap.add_argument("--dry-run", action="store_true", help="Simula o import numa cópia em memória do DB")
     args = ap.parse_args()
 
     csv_path = args.csv
@@ -242,13 +281,13 @@ def main() -> int:
         deduped.append(r)
 
     if args.dry_run:
-        print(f"[import-contatos] DRY RUN: {len(deduped)} linhas válidas após dedupe (de {len(rows)}).")
-        return 0
-
-    backup = backup_db(db_path, "data/backups")
-    print(f"[import-contatos] Backup: {backup}")
-
-    conn = sqlite3.connect(db_path)
+        backup = None
+        conn = load_db_in_memory(db_path)
+        print(f"[import-contatos] DRY RUN: {db_path} carregado em memória; nada será gravado.")
+    else:
+        backup = backup_db(db_path, "data/backups")
+        print(f"[import-contatos] Backup: {backup}")
+        conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     cur = conn.cursor()
     cur.execute("PRAGMA foreign_keys=ON;")
@@ -262,21 +301,22 @@ def main() -> int:
         conn.close()
         return 2
 
+    deleted_sample: list[tuple] = []
+    inserted_sample: list[tuple] = []
+
     # Remove duplicates already present (keep one row by rowid)
     cur.execute("BEGIN;")
     try:
-        cur.execute(
-            """
-            DELETE FROM urede_cooperativa_contatos
-            WHERE rowid NOT IN (
-              SELECT MIN(rowid)
-              FROM urede_cooperativa_contatos
-              GROUP BY id_singular,
-                       lower(trim(tipo)),
-                       CASE WHEN lower(trim(tipo))='email' THEN lower(trim(valor)) ELSE trim(valor) END
-            );
-            """
-        )
+        if args.dry_run:
+            deleted_sample = [
+                tuple(r)
+                for r in cur.execute(
+                    f"SELECT id_singular, tipo, valor FROM urede_cooperativa_contatos WHERE {DUPLICADOS_WHERE} LIMIT ?;",
+                    (DIFF_SAMPLE,),
+                ).fetchall()
+            ]
+        cur.execute(f"DELETE FROM urede_cooperativa_contatos WHERE {DUPLICADOS_WHERE};")
+        deleted = cur.rowcount
 
         # Insert non-existing
         inserted = 0
@@ -309,13 +349,24 @@ def main() -> int:
                 (r["id_singular"], r["tipo"], r["subtipo"], r["valor"], r["principal"], r["label"]),
             )
             inserted += 1
-
-        conn.commit()
-        print(f"[import-contatos] OK inserted={inserted} skipped={skipped} (csv_deduped={len(deduped)})")
+            if len(inserted_sample) < DIFF_SAMPLE:
+                inserted_sample.append((r["id_singular"], r["tipo"], r["valor"]))
+
+        if args.dry_run:
+            conn.rollback()
+            print(
+                f"[import-contatos] DRY RUN inserted={inserted} skipped={skipped} deleted={deleted} "
+                f"(csv_deduped={len(deduped)} de {len(rows)})"
+            )
+            print_diff_sample(deleted_sample, inserted_sample, deleted, inserted)
+        else:
+            conn.commit()
+            print(f"[import-contatos] OK inserted={inserted} skipped={skipped} deleted={deleted} (csv_deduped={len(deduped)})")
     except Exception as e:
         conn.rollback()
         print("[import-contatos] ERRO, rollback executado:", str(e), file=sys.stderr)
-        print(f"[import-contatos] Para desfazer totalmente: cp -f '{backup}' '{db_path}'", file=sys.stderr)
+        if backup:
+            print(f"[import-contatos] Para desfazer totalmente: cp -f '{backup}' '{db_path}'", file=sys.stderr)
         conn.close()
         return 1
 
@@ -9,6 +9,8 @@ Regras:
   - Email: lower-case e trim
   - Website: garante http/https, remove fragment, normaliza host e remove "/" final
 - Ignora coluna ativo (sempre ativo=1)
+- --dry-run: executa dedupe e inserção numa cópia em memória do DB e só
+  reporta contagens e uma amostra do diff (sem backup e sem gravar no arquivo)
 """
 
 from __future__ import annotations
@@ -24,12 +26,16 @@ import unicodedata
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse, urlunparse
 
 
 EMAIL_RE = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
 
+# Quantidade de linhas exibidas no diff de amostra do dry-run.
+DIFF_SAMPLE = 10
+
 
 def normalize_enum_text(value: str) -> str:
     s = (value or "").strip().lower()
@@ -155,7 +161,19 @@ def backup_db(db_path: str, backups_dir: str) -> str:
     return dst
 
 
-def dedupe_existing(conn: sqlite3.Connection) -> int:
+def load_db_in_memory(db_path: str) -> sqlite3.Connection:
+    # Abre o arquivo somente leitura e copia para :memory: via backup API,
+    # sem copiar arquivo nem segurar lock de escrita no DB de produção.
+    src = sqlite3.connect(Path(db_path).resolve().as_uri() + "?mode=ro", uri=True)
+    mem = sqlite3.connect(":memory:")
+    try:
+        src.backup(mem)
+    finally:
+        src.close()
+    return mem
+
+
+def dedupe_existing(conn: sqlite3.Connection, removed: Optional[List[str]] = None) -> int:
     cur = conn.cursor()
     cur.execute(
         """
@@ -196,6 +214,8 @@ def dedupe_existing(conn: sqlite3.Connection) -> int:
                 delete_ids,
             )
             deleted += len(delete_ids)
+            if removed is not None:
+                removed.extend(key for _ in delete_ids)
         # Ensure keep principal if any had principal=1
         if any(p == 1 for (_, p, _) in items) and items_sorted[0][1] != 1:
             cur.execute(
@@ -286,6 +306,7 @@ def main() -> int:
     ap.add_argument("--db", required=True, help="Caminho do SQLite DB (ex.: data/urede.db.nwal)")
     ap.add_argument("--csv", required=True, help="Caminho do CSV de contatos")
     ap.add_argument("--backups-dir", default="data/backups", help="Pasta de backups")
+    ap.add_argument("--dry-run", action="store_true", help="Simula o import numa cópia em memória do DB")
     args = ap.parse_args()
 
     if not os.path.exists(args.db):
@@ -295,10 +316,13 @@ def main() -> int:
         print(f"CSV não encontrado: {args.csv}", file=sys.stderr)
         return 2
 
-    backup_path = backup_db(args.db, args.backups_dir)
-    print(f"[backup] {backup_path}")
-
-    conn = sqlite3.connect(args.db, timeout=30)
+    if args.dry_run:
+        conn = load_db_in_memory(args.db)
+        print(f"[dry-run] {args.db} carregado em memória; nada será gravado.")
+    else:
+        backup_path = backup_db(args.db, args.backups_dir)
+        print(f"[backup] {backup_path}")
+        conn = sqlite3.connect(args.db, timeout=30)
     conn.execute("PRAGMA foreign_keys = ON")
     try:
         existing_ids = get_existing_cooperativas(conn)
@@ -311,12 +335,14 @@ def main() -> int:
             if len(invalid) > 25:
                 print("  - ...")
 
+        removed: List[str] = []
         conn.execute("BEGIN IMMEDIATE")
-        deleted = dedupe_existing(conn)
+        deleted = dedupe_existing(conn, removed)
         if deleted:
             print(f"[dedupe] removidos duplicados existentes: {deleted}")
 
         seen: set[str] = set()
+        added: List[str] = []
         inserted = 0
         skipped_existing = 0
         skipped_dup_in_file = 0
@@ -337,12 +363,29 @@ def main() -> int:
                 continue
             insert_contato(conn, c)
             inserted += 1
-
-        conn.commit()
-        print(f"[import] inseridos: {inserted}")
-        print(f"[import] ignorados (já existiam): {skipped_existing}")
-        print(f"[import] ignorados (duplicados no arquivo): {skipped_dup_in_file}")
-        print(f"[import] ignorados (id_singular não existe em cooperativas): {skipped_missing_coop}")
+            if len(added) < DIFF_SAMPLE:
+                added.append(k)
+
+        if args.dry_run:
+            conn.rollback()
+        else:
+            conn.commit()
+        prefix = "[dry-run]" if args.dry_run else "[import]"
+        print(f"{prefix} inseridos: {inserted}")
+        print(f"{prefix} ignorados (já existiam): {skipped_existing}")
+        print(f"{prefix} ignorados (duplicados no arquivo): {skipped_dup_in_file}")
+        print(f"{prefix} ignorados (id_singular não existe em cooperativas): {skipped_missing_coop}")
+        if args.dry_run:
+            print(f"[dry-run] removidos (duplicados existentes): {deleted}")
+            print("[dry-run] amostra do diff (id_singular|tipo|valor):")
+            for k in removed[:DIFF_SAMPLE]:
+                print(f"  - {k}")
+            if len(removed) > DIFF_SAMPLE:
+                print(f"  - ... (+{len(removed) - DIFF_SAMPLE})")
+            for k in added:
+                print(f"  + {k}")
+            if inserted > len(added):
+                print(f"  + ... (+{inserted - len(added)})")
     except Exception as e:
         conn.rollback()
         print(f"[erro] import falhou, rollback executado: {e}", file=sys.stderr)